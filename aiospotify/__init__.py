@@ -8,8 +8,16 @@ An unofficial asynchronous wrapper to interact with Spotify API
 :license: MIT, see LICENSE for more details.
 """
 
-from .client import *
-from .errors import *
+from .client import SpotifyClient
+from .errors import (
+    SpotifyException,
+    NotAuthorized,
+    HTTPException,
+    InvalidClientCredentials,
+    Forbidden,
+    NotFound,
+    ServerError,
+)
 
 __title__ = "aiospotify"
 __author__ = "AkshuAgarwal"
@@ -17,6 +25,8 @@ __license__ = "MIT"
 __copyright__ = "Copyright (c) 2021 AkshuAgarwal"
 __version__ = "0.0.1a"
 
-import logging
+import logging as _logging
 
-logging.getLogger(__name__).addHandler(logging.NullHandler())
+_log = _logging.getLogger(__name__)
+if not _log.handlers:  # Don't stack up NullHandlers when the package is reloaded
+    _log.addHandler(_logging.NullHandler())
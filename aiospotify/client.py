@@ -23,22 +23,103 @@ SOFTWARE.
 """
 
 from __future__ import annotations
-from typing import Optional, Tuple
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TYPE_CHECKING,
+)
 
 import asyncio
+import binascii
+import copy
+import functools
+import logging
+import threading
 
-from .http import HTTPClient
+from ._utils import retrieve_exception
+from .errors import HTTPException, NotAuthorized, NotFound
+from .types._spotify import ID, MARKETS, RESPONSE
+
+if TYPE_CHECKING:
+    from .http import HTTPClient
 
 
 __all__: Tuple[str] = ("SpotifyClient",)
 
 
+log = logging.getLogger(__name__)
+
+
+def _is_invalid_id_error(exc: BaseException) -> bool:
+    # The 400 Spotify answers with when one of the requested IDs is malformed
+    return (
+        isinstance(exc, HTTPException)
+        and exc.status_code == 400
+        and exc.description is not None
+        and "invalid id" in exc.description.lower()
+    )
+
+
+def _set_exception(futures: List[asyncio.Future], exc: BaseException) -> None:
+    for future in futures:
+        if future.done():
+            continue
+
+        # Every caller gets its own copy, so their tracebacks don't pile up on one instance
+        try:
+            future.set_exception(copy.copy(exc))
+        except Exception:
+            future.set_exception(exc)
+        retrieve_exception(future)
+
+
+class _LoopState:
+    # Everything of the client that's bound to the event loop it's created in
+
+    __slots__ = (
+        "loop",
+        "http",
+        "refresh_task",
+        "auth_inflight",
+        "pending",
+        "flush_handle",
+        "batch_tasks",
+        "entries",
+    )
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, http: HTTPClient) -> None:
+        self.loop: asyncio.AbstractEventLoop = loop
+        self.http: HTTPClient = http
+        self.refresh_task: Optional[asyncio.Task] = None
+        self.auth_inflight: Optional[asyncio.Future] = None
+
+        # The futures of the single track lookups waiting to be batched, grouped by
+        # market and ID. Each caller gets its own future, even for the same ID.
+        self.pending: Dict[Optional[MARKETS], Dict[ID, List[asyncio.Future]]] = {}
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+        self.batch_tasks: Set[asyncio.Task] = set()
+
+        # Number of `async with` blocks the client is in, only the outermost one closes it
+        self.entries: int = 0
+
+
 class SpotifyClient:
     """The Base class to connect and utilise the Spotify API.
 
     Currently, the wrapper only supports authorization with client_id and client_secret,
     because of which, some endpoints may be unavailable.
 
+    The client doesn't accept an event loop, it always works with the loop it's
+    running in. Code that used to pass a custom loop should instead run the client's
+    coroutines in that loop, e.g. with :meth:`asyncio.loop.run_until_complete`.
+
     Examples
     ---------
 
@@ -47,46 +128,164 @@ class SpotifyClient:
         import asyncio
         from aiospotify import SpotifyClient
 
+        async def main():
+            # Authorizes on enter and closes all the sessions on exit
+            async with SpotifyClient('client_id', 'client_secret') as spotify_client:
+                tracks = await spotify_client.get_tracks(['track_id', ...])
+
+        asyncio.run(main())
+
+    The client can be entered again while it's already entered, e.g. in nested
+    ``async with`` blocks. It is only closed when the outermost block exits.
+
+    Authorizing and closing manually: ::
+
         spotify_client = SpotifyClient('client_id', 'client_secret')
 
         async def main():
             await spotify_client.authorize() # This function must be called before making any requests
-            # TODO: Later
+            tracks = await spotify_client.get_tracks(['track_id', ...])
             await spotify_client.close()
 
-        asyncio.run(main())
-
     Parameters
     -----------
     client_id: :class:`str`
         The unique Client ID provided by the Spotify while creating an application.
     client_secret: :class:`str`
         The unique Client Secret Key provided by the Spotify while creating an application.
-    loop: Optional[:class:`asyncio.AbstractEventLoop`]
-        The :class:`asyncio.AbstractEventLoop` to use for asynchronous operations.
-        Defaults to ``None``. If not provided, the default event loop is used via
-        :func:`asyncio.get_event_loop()`.
+    connector_limit: :class:`int`
+        The maximum number of simultaneous connections. Defaults to ``100``.
+    connector_limit_per_host: :class:`int`
+        The maximum number of simultaneous connections to the same host. Defaults to ``10``.
+    dns_cache_ttl: :class:`int`
+        Seconds for which the resolved DNS entries are cached. Defaults to ``20``.
+    max_concurrency: Optional[:class:`int`]
+        The maximum number of API requests in flight at once. Defaults to
+        ``connector_limit_per_host``, or ``connector_limit`` if that is ``0``, since
+        every request goes to the same host. A higher value only makes the requests
+        over the limit queue up for a connection, and they skip the wait for a rate
+        limit that started while they were queued.
+    cache_ttl: :class:`float`
+        Seconds for which the responses are cached and reused for the same requests.
+        Defaults to ``60``. Every request gets its own copy of a cached response,
+        so modifying a returned response doesn't affect the later ones.
+    cache_size: :class:`int`
+        The maximum number of cached responses. Defaults to ``1024``,
+        ``0`` disables the cache.
     """
 
+    __slots__ = (
+        "client_id",
+        "client_secret",
+        "_basic_auth",
+        "_http_options",
+        "_loop_states",
+        "_loop_lock",
+        "__weakref__",
+    )
+
+    MAX_IDS_PER_REQUEST: ClassVar[int] = 50
+    # Seconds to wait for more IDs to batch together
+    BATCH_DELAY: ClassVar[float] = 0.005
+    # Seconds before the expiry to refresh the token at
+    REFRESH_MARGIN: ClassVar[float] = 60
+    REFRESH_RETRY_DELAY: ClassVar[float] = 10
+
     def __init__(
         self,
         client_id: str,
         client_secret: str,
         *,
-        loop: Optional[asyncio.AbstractEventLoop] = None
+        connector_limit: int = 100,
+        connector_limit_per_host: int = 10,
+        dns_cache_ttl: int = 20,
+        max_concurrency: Optional[int] = None,
+        cache_ttl: float = 60,
+        cache_size: int = 1024,
     ) -> None:
         self.client_id = client_id
         self.client_secret = client_secret
 
-        if not loop:
-            loop = asyncio.get_event_loop()
+        self._http_options: Dict[str, Any] = {
+            "limit": connector_limit,
+            "limit_per_host": connector_limit_per_host,
+            "ttl_dns_cache": dns_cache_ttl,
+            "max_concurrency": max_concurrency,
+            "cache_ttl": cache_ttl,
+            "cache_size": cache_size,
+        }
+
+        # The credentials never change, so the header for the token request is built only once
+        self._basic_auth: str = "Basic " + binascii.b2a_base64(
+            f"{client_id}:{client_secret}".encode("ascii"), newline=False
+        ).decode("ascii")
+
+        # The HTTPClient and the tasks of each event loop (keyed by the loop ID), since
+        # their session and futures can only be used in the loop they're created in.
+        # It allows to reuse the same client in environments which run each job in a
+        # new loop (Celery workers, Cloud Run, ...), or in multiple threads at once.
+        self._loop_states: Dict[int, _LoopState] = {}
+        self._loop_lock: threading.Lock = threading.Lock()
+
+    async def __aenter__(self) -> SpotifyClient:
+        state, created = self._get_or_create_state()
+        try:
+            await self._authorize(state)
+        except BaseException:
+            # __aexit__ isn't called when entering fails, close the session here instead.
+            # A state that was already there before entering is left as is.
+            if created:
+                await self._close_state(state)
+            raise
+        state.entries += 1
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        state = self._loop_states.get(id(asyncio.get_running_loop()))
+        if state is None:  # Already closed
+            return
+
+        state.entries -= 1
+        if state.entries <= 0:
+            await self._close_state(state)
+
+    @property
+    def http(self) -> HTTPClient:
+        """The :class:`HTTPClient` of the running event loop.
+
+        Every event loop gets its own HTTP client, created by :meth:`authorize`, which
+        means that it has to be called (or the client entered) in each of the loops
+        it's used in.
+
+        Raises
+        -------
+        :exc:`.NotAuthorized`
+            The client isn't authorized in the running event loop.
+        """
+        return self._state().http
+
+    def _state(self) -> _LoopState:
+        state = self._loop_states.get(id(asyncio.get_running_loop()))
+        if state is None:
+            raise NotAuthorized(
+                "You need to authorize first before making any requests"
+            )
+        return state
 
-        self.http = HTTPClient(client_id, client_secret, loop=loop)
+    def _prune_closed_loops(self) -> None:
+        # The entries hold a reference to their loop, so a loop ID
+        # can't be reused by a new loop until it's pruned from here
+        for key, state in list(self._loop_states.items()):
+            if state.loop.is_closed():
+                del self._loop_states[key]
 
     async def authorize(self) -> None:
         """The method which authorizes to the API. This should be called first
         before making any requests to the API.
 
+        Nothing is requested if the client already holds a valid token in the
+        running event loop.
+
         Raises
         -------
         :exc:`.InvalidClientCredentials`
@@ -98,8 +297,294 @@ class SpotifyClient:
             Spotify Server Side errors.
             Most of the time we can do nothing about it.
         """
-        await self.http.authorize()
+        await self._authorize(self._get_or_create_state()[0])
+
+    def _get_or_create_state(self) -> Tuple[_LoopState, bool]:
+        # The state of the running loop, and whether it was created by this call
+        loop = asyncio.get_running_loop()
+
+        state = self._loop_states.get(id(loop))
+        if state is not None:
+            return state, False
+
+        with self._loop_lock:
+            state = self._loop_states.get(id(loop))
+            if state is not None:
+                return state, False
+
+            # Imported here so that importing the package doesn't import aiohttp
+            from .http import HTTPClient
+
+            self._prune_closed_loops()
+            state = _LoopState(loop, HTTPClient(self._basic_auth, **self._http_options))
+            self._loop_states[id(loop)] = state
+            return state, True
+
+    async def _authorize(self, state: _LoopState) -> None:
+        # A token that's still valid is left for the refresh loop to renew
+        if state.http.expires_in <= self.REFRESH_MARGIN:
+            await self._refresh_token(state)
+
+        if state.refresh_task is None or state.refresh_task.done():
+            state.refresh_task = asyncio.create_task(self._refresh_loop(state))
+
+    async def _refresh_token(self, state: _LoopState) -> None:
+        # Concurrent calls share the same in-flight token request,
+        # instead of each one of them requesting a new token.
+        if state.auth_inflight is None:
+            state.auth_inflight = asyncio.ensure_future(state.http.authorize())
+            state.auth_inflight.add_done_callback(
+                functools.partial(self._clear_auth_inflight, state)
+            )
+
+        await asyncio.shield(state.auth_inflight)
+
+    def _clear_auth_inflight(self, state: _LoopState, future: asyncio.Future) -> None:
+        state.auth_inflight = None
+        retrieve_exception(future)
+
+    async def _refresh_loop(self, state: _LoopState) -> None:
+        # Refreshes the access token shortly before it expires,
+        # so requests never have to wait for the authorization.
+        while True:
+            try:
+                # Checked again after waking up, since the token may have been
+                # refreshed in the meantime (e.g. by a request that got a 401)
+                delay = state.http.expires_in - self.REFRESH_MARGIN
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                    continue
+
+                await self._refresh_token(state)
+
+                if state.http.expires_in <= self.REFRESH_MARGIN:
+                    # HTTPClient.authorize doesn't raise on every failed response, and
+                    # the token is still the old one. Wait before asking for it again.
+                    log.warning(
+                        "The access token wasn't refreshed. Retrying in %s seconds.",
+                        self.REFRESH_RETRY_DELAY,
+                    )
+                    await asyncio.sleep(self.REFRESH_RETRY_DELAY)
+            except Exception:
+                log.exception(
+                    "Failed to refresh the access token. Retrying in %s seconds.",
+                    self.REFRESH_RETRY_DELAY,
+                )
+                await asyncio.sleep(self.REFRESH_RETRY_DELAY)
 
     async def close(self) -> None:
-        """Closes all the sessions and connections."""
-        await self.http.destroy()
+        """Closes all the sessions and connections of the running event loop."""
+        state = self._loop_states.get(id(asyncio.get_running_loop()))
+        if state is None:
+            with self._loop_lock:
+                self._prune_closed_loops()
+            return
+
+        await self._close_state(state)
+
+    async def _close_state(self, state: _LoopState) -> None:
+        with self._loop_lock:
+            self._prune_closed_loops()
+            if self._loop_states.get(id(state.loop)) is not state:
+                return  # Already closed
+            del self._loop_states[id(state.loop)]
+
+        if state.refresh_task is not None:
+            state.refresh_task.cancel()
+
+        if state.flush_handle is not None:
+            state.flush_handle.cancel()
+
+        for waiters in state.pending.values():
+            for futures in waiters.values():
+                for future in futures:
+                    future.cancel()
+        state.pending.clear()
+
+        for task in state.batch_tasks:
+            task.cancel()
+
+        await state.http.destroy()
+
+    async def _request_many(
+        self,
+        fetch: Callable[..., Awaitable[RESPONSE]],
+        ids: List[ID],
+        key: str,
+        **kwargs: Any,
+    ) -> List[RESPONSE]:
+        # Spotify accepts at most 50 IDs per request on the "several items" endpoints,
+        # so split the IDs in chunks and dispatch all of them concurrently.
+        tasks = [
+            asyncio.ensure_future(
+                fetch(ids[i : i + self.MAX_IDS_PER_REQUEST], **kwargs)
+            )
+            for i in range(0, len(ids), self.MAX_IDS_PER_REQUEST)
+        ]
+        try:
+            # gather() keeps submission order, so the items are returned in the order of ``ids``
+            responses = await asyncio.gather(*tasks)
+        except BaseException:
+            # One chunk failed (or the caller was cancelled). Nobody needs the rest of
+            # them anymore, so cancel them and retrieve their exceptions.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return [item for response in responses for item in response[key]]
+
+    async def get_tracks(
+        self, ids: List[ID], *, market: Optional[MARKETS] = None
+    ) -> List[RESPONSE]:
+        """Fetches the catalog information of multiple tracks.
+
+        Any number of IDs can be passed, they are requested in batches
+        of 50 (the maximum Spotify allows) instead of one request per track.
+
+        Parameters
+        -----------
+        ids: List[:class:`str`]
+            The Spotify IDs of the tracks.
+        market: Optional[:class:`str`]
+            An ISO 3166-1 alpha-2 country code to apply Track Relinking for.
+
+        Returns
+        --------
+        List[Dict[:class:`str`, Any]]
+            The tracks in the same order as ``ids``. Unknown IDs are returned as ``None``.
+        """
+        return await self._request_many(
+            self.http.get_tracks, ids, "tracks", market=market
+        )
+
+    async def get_track(self, id: ID, *, market: Optional[MARKETS] = None) -> RESPONSE:
+        """Fetches the catalog information of a single track.
+
+        Lookups made concurrently (e.g. from different tasks) within a few milliseconds
+        of each other are coalesced into a single request for multiple tracks.
+
+        Parameters
+        -----------
+        id: :class:`str`
+            The Spotify ID of the track.
+        market: Optional[:class:`str`]
+            An ISO 3166-1 alpha-2 country code to apply Track Relinking for.
+
+        Raises
+        -------
+        :exc:`.NotFound`
+            No track exists with the given ID.
+        :exc:`.HTTPException`
+            The batched request failed.
+
+        Returns
+        --------
+        Dict[:class:`str`, Any]
+            The track.
+        """
+        state = self._state()
+        pending = state.pending.setdefault(market, {})
+
+        future = state.loop.create_future()
+        futures = pending.get(id)
+        if futures is None:
+            pending[id] = [future]
+
+            if len(pending) >= self.MAX_IDS_PER_REQUEST:
+                self._flush(state)
+            elif state.flush_handle is None:
+                state.flush_handle = state.loop.call_later(
+                    self.BATCH_DELAY, self._flush, state
+                )
+        else:
+            futures.append(future)
+
+        # Cancelling the caller cancels only its own future, the lookup
+        # goes on for the other callers of the same ID
+        return await future
+
+    def _flush(self, state: _LoopState) -> None:
+        if state.flush_handle is not None:
+            state.flush_handle.cancel()
+            state.flush_handle = None
+
+        pending, state.pending = state.pending, {}
+        for market, waiters in pending.items():
+            task = asyncio.ensure_future(self._dispatch_batch(state, waiters, market))
+            # Keep a reference so the task isn't garbage collected while it's running
+            state.batch_tasks.add(task)
+            task.add_done_callback(state.batch_tasks.discard)
+
+    async def _dispatch_batch(
+        self,
+        state: _LoopState,
+        waiters: Dict[ID, List[asyncio.Future]],
+        market: Optional[MARKETS],
+    ) -> None:
+        try:
+            data = await state.http.get_tracks(list(waiters), market=market)
+
+        except asyncio.CancelledError:
+            for futures in waiters.values():
+                for future in futures:
+                    future.cancel()
+            raise
+        except Exception as exc:
+            if len(waiters) > 1 and _is_invalid_id_error(exc):
+                # A single malformed ID makes Spotify reject the whole batch. Split it
+                # in halves until the bad ID is alone, so only its callers get the error.
+                # Other 400s (e.g. an invalid market) apply to every ID and aren't split.
+                items = list(waiters.items())
+                half = len(items) // 2
+                await asyncio.gather(
+                    self._dispatch_batch(state, dict(items[:half]), market),
+                    self._dispatch_batch(state, dict(items[half:]), market),
+                )
+            else:
+                for futures in waiters.values():
+                    _set_exception(futures, exc)
+
+        else:
+            for futures, track in zip(waiters.values(), data["tracks"]):
+                if track is None:  # Spotify returns null for the IDs that don't exist
+                    _set_exception(
+                        futures,
+                        NotFound(
+                            {"error": {"status": 404, "message": "non existing id"}},
+                            404,
+                        ),
+                    )
+                else:
+                    last = futures[-1]
+                    for future in futures:
+                        if not future.done():
+                            # Every caller of the same ID gets a track of its own
+                            future.set_result(
+                                track if future is last else copy.deepcopy(track)
+                            )
+
+        finally:
+            # Nothing else resolves these, so fail the IDs that the response left out
+            # instead of leaving their callers waiting forever
+            for futures in waiters.values():
+                _set_exception(
+                    futures, HTTPException("No track was returned for the requested ID")
+                )
+
+    async def get_artists(self, ids: List[ID]) -> List[RESPONSE]:
+        """Fetches the catalog information of multiple artists.
+
+        Any number of IDs can be passed, they are requested in batches
+        of 50 (the maximum Spotify allows) instead of one request per artist.
+
+        Parameters
+        -----------
+        ids: List[:class:`str`]
+            The Spotify IDs of the artists.
+
+        Returns
+        --------
+        List[Dict[:class:`str`, Any]]
+            The artists in the same order as ``ids``. Unknown IDs are returned as ``None``.
+        """
+        return await self._request_many(self.http.get_multiple_artists, ids, "artists")
@@ -23,7 +23,7 @@ SOFTWARE.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, Optional
+from typing import Any, ClassVar, Dict, Optional, Union
 
 
 class SpotifyException(Exception):
@@ -40,17 +40,57 @@ class NotAuthorized(SpotifyException):
 
 
 class HTTPException(SpotifyException):
-    """Base Exception for all the HTTP Requests related Exceptions"""
+    """Base Exception for all the HTTP Requests related Exceptions.
+
+    Can be raised either with the error data returned by Spotify, or
+    with an already formatted message.
+
+    Attributes
+    -----------
+    status_code: Optional[:class:`int`]
+        The HTTP status code of the response.
+    error: Optional[:class:`str`]
+        The short error code, only sent by Spotify on authorization errors.
+    description: Optional[:class:`str`]
+        The human readable description of the error.
+    raw: Optional[Dict[:class:`str`, Any]]
+        The raw error data returned by Spotify.
+    """
+
+    default_status: ClassVar[Optional[int]] = None
 
     def __init__(
-        self, data: Dict[str, Any], status_code: int, message: Optional[str] = None
+        self,
+        data: Union[Dict[str, Any], str],
+        status_code: Optional[int] = None,
+        message: Optional[str] = None,
     ) -> None:
-        fmt = f'{status_code} {data["error"]}'
-        if desc := data.get("error_description") is not None:
-            fmt += f": {desc}"
-
-        if msg := data.get("message") is not None:
-            fmt += f": {msg}"
+        if status_code is None:
+            status_code = self.default_status
+        self.status_code: Optional[int] = status_code
+
+        if isinstance(data, str):  # Already formatted, nothing to build
+            self.error = self.description = self.raw = None
+            Exception.__init__(self, data)
+            return
+
+        self.raw: Optional[Dict[str, Any]] = data
+
+        error = data["error"]
+        if isinstance(error, dict):
+            # Regular error object - {"error": {"status": ..., "message": ...}}
+            self.error: Optional[str] = None
+            self.description: Optional[str] = error.get("message")
+            fmt = f"{status_code}: {self.description}"
+        else:
+            # Authentication error object - {"error": ..., "error_description": ...}
+            self.error = error
+            self.description = desc = data.get("error_description")
+            fmt = (
+                f"{status_code} {error}: {desc}"
+                if desc is not None
+                else f"{status_code} {error}"
+            )
 
         if message is not None:
             fmt += f" ({message})"
@@ -61,13 +101,13 @@ class HTTPException(SpotifyException):
 class InvalidClientCredentials(HTTPException):
     """The client_id or client_secret is Invalid"""
 
-    pass
+    default_status = 400
 
 
 class Forbidden(HTTPException):
     """Forbidden (The server understood the request, but is refusing to fulfill it)"""
 
-    pass
+    default_status = 403
 
 
 class NotFound(HTTPException):
@@ -75,10 +115,10 @@ class NotFound(HTTPException):
     This error can be due to a temporary or permanent condition.
     """
 
-    pass
+    default_status = 404
 
 
 class ServerError(HTTPException):
     """Server side error. Possibly nothing we can do for this."""
 
-    pass
+    default_status = 500
@@ -23,15 +23,35 @@ SOFTWARE.
 """
 
 from __future__ import annotations
-from typing import Any, ClassVar, Dict, List, Literal, Optional, Tuple, TYPE_CHECKING
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlencode
 
 import asyncio
 import aiohttp
-import base64
-import datetime
-import six
+import functools
+import inspect
 import logging
+import math
+import string
+import sys
+import time
+import yarl
 
+from ._utils import retrieve_exception
 from .errors import (
     HTTPException,
     InvalidClientCredentials,
@@ -42,6 +62,7 @@ from .errors import (
 )
 from .types._spotify import ID, MARKETS, PARAMS, RESPONSE
 
+# Both of them parse bytes directly, so the response body never has to be decoded first
 try:
     import orjson
 
@@ -58,16 +79,133 @@ __all__: Tuple[str] = ("HTTPClient",)
 log = logging.getLogger(__name__)
 
 
-class Route:
-    __slots__ = ("path", "method", "url", "params")
+@functools.lru_cache(maxsize=512)
+def _url_for(base: str, path: str) -> yarl.URL:
+    # aiohttp parses and requotes every str URL it's given, but uses a URL object as is.
+    # Paths repeat a lot (static endpoints, or the same IDs), so parse each one only once.
+    return yarl.URL(base + path)
+
+
+def _decode(body: bytes) -> Optional[RESPONSE]:
+    # A 204 (No Content) has an empty body
+    return _from_json(body) if body else None
+
+
+def _error_data(response: aiohttp.ClientResponse, body: bytes) -> Union[RESPONSE, str]:
+    # Error responses aren't always Spotify's JSON error objects, e.g. the HTML page of
+    # a 502 from the edge. Those are passed on as text, which HTTPException also takes.
+    try:
+        data = _from_json(body)
+    except ValueError:
+        pass
+    else:
+        if isinstance(data, dict) and "error" in data:
+            return data
+
+    text = body.decode("utf-8", "replace").strip()
+    if text:
+        return f"{response.status} {response.reason}: {text}"
+    return f"{response.status} {response.reason}"
+
+
+class Route(NamedTuple):
+    method: str
+    path: str
+    # None (and not an empty list) lets aiohttp skip the query building entirely
+    params: Optional[PARAMS] = None
 
-    BASE: ClassVar[str] = "https://api.spotify.com/v1/"
+    BASE = "https://api.spotify.com/v1/"
 
-    def __init__(self, method: str, path: str, params: Optional[PARAMS] = None) -> None:
-        self.path: str = path
-        self.method: str = method
-        self.url: str = self.BASE + self.path
-        self.params: Optional[Dict[str, str]] = params if params else None
+    @property
+    def url(self) -> yarl.URL:
+        return _url_for(self.BASE, self.path)
+
+    @property
+    def key(self) -> str:
+        """Identifies the request, whichever order the params were given in"""
+        if self.params is None:
+            return f"{self.method} {self.url}"
+        return f"{self.method} {self.url}?{urlencode(sorted(self.params))}"
+
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Awaitable[RESPONSE]])
+
+
+def endpoint(
+    method: str,
+    path: str,
+    *,
+    lists: Tuple[str, ...] = (),
+    aliases: Optional[Dict[str, str]] = None,
+) -> Callable[[EndpointT], EndpointT]:
+    """Turns the decorated stub method into a request to an endpoint.
+
+    The arguments named in ``path`` are formatted into it and the rest of them are
+    sent as the query params, under the name given in ``aliases`` if any. The
+    arguments named in ``lists`` are comma separated, everything else is sent as
+    ``str(value)``. Unset (``None``) and empty values are left out.
+    """
+    aliases = aliases or {}
+
+    def decorator(func: EndpointT) -> EndpointT:
+        # Everything that can be worked out from the signature is done once, here
+        signature = inspect.signature(func)
+        parameters = list(signature.parameters.values())[1:]  # Without self
+
+        names = frozenset(param.name for param in parameters)
+        unknown = (set(lists) | set(aliases)) - names
+        if unknown:
+            raise TypeError(
+                f"{func.__name__} has no arguments named {sorted(unknown)}"
+            )
+
+        positional = tuple(
+            param.name
+            for param in parameters
+            if param.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+        )
+        defaults = {
+            param.name: param.default
+            for param in parameters
+            if param.default is not inspect.Parameter.empty
+        }
+
+        in_path = {field for _, field, _, _ in string.Formatter().parse(path) if field}
+        query = tuple(
+            (param.name, aliases.get(param.name, param.name), param.name in lists)
+            for param in parameters
+            if param.name not in in_path
+        )
+
+        @functools.wraps(func)
+        async def wrapper(self: HTTPClient, *args: Any, **kwargs: Any) -> RESPONSE:
+            arguments = dict(zip(positional, args))
+            if len(args) > len(positional) or not arguments.keys().isdisjoint(kwargs):
+                signature.bind(self, *args, **kwargs)  # Raises the usual TypeError
+            arguments = {**defaults, **arguments, **kwargs}
+            if arguments.keys() != names:  # Missing or unexpected arguments
+                signature.bind(self, *args, **kwargs)
+
+            params: PARAMS = []
+            for name, key, is_list in query:
+                value = arguments[name]
+                if value is None:
+                    continue
+                if is_list:
+                    value = ",".join(value)
+                elif isinstance(value, bool):
+                    value = "true" if value else "false"
+                else:
+                    value = str(value)
+                if value:
+                    params.append((key, value))
+
+            route_path = path.format_map(arguments) if in_path else path
+            return await self.request(Route(method, route_path, params or None))
+
+        return wrapper  # type: ignore
+
+    return decorator
 
 
 class HTTPClient:
@@ -75,27 +213,101 @@ class HTTPClient:
     This is meant to be used internally only.
     """
 
+    __slots__ = (
+        "lock",
+        "_token_headers",
+        "_session",
+        "_access_token",
+        "_auth_headers",
+        "_expires_at",
+        "_semaphore",
+        "_retry_at",
+        "_cache",
+        "_cache_ttl",
+        "_cache_size",
+        "_inflight",
+        "_inflight_waiters",
+    )
+
     ACCOUNT_BASE: ClassVar[str] = "https://accounts.spotify.com/api/"
+    TOKEN_BODY: ClassVar[Dict[str, str]] = {"grant_type": "client_credentials"}
+
+    # Paths whose responses never change, these are cached for the client's lifetime
+    PERMANENT_PATHS: ClassVar[frozenset] = frozenset({"markets"})
 
-    if TYPE_CHECKING:
-        _access_token: str
-        _expires_at: datetime.datetime
-        session: aiohttp.ClientSession
+    # SpotifyClient refreshes the token before it expires. In case that didn't happen,
+    # requests wait for a new one when the token is going to expire in EXPIRY_MARGIN.
+    EXPIRY_MARGIN: ClassVar[timedelta] = timedelta(seconds=10)
 
     def __init__(
-        self, client_id: str, client_secret: str, *, loop: asyncio.AbstractEventLoop
+        self,
+        basic_auth: str,
+        *,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        ttl_dns_cache: int = 20,
+        max_concurrency: Optional[int] = None,
+        cache_ttl: float = 60,
+        cache_size: int = 1024,
     ) -> None:
-        self.client_id: str = client_id
-        self.client_secret: str = client_secret
-
-        self.loop: asyncio.AbstractEventLoop = loop
-        self.lock: asyncio.Lock = asyncio.Lock(loop=self.loop)
+        # Headers of the token request, built from the pre-encoded
+        # "Basic <base64 client_id:client_secret>" value. They never change.
+        self._token_headers: Dict[str, str] = {"Authorization": basic_auth}
+
+        # A single session is used for the whole lifetime of the client. As every request
+        # goes to the same couple of hosts, its pool keeps the connections alive and skips
+        # the TCP and TLS handshakes for every request. This must be constructed in the
+        # running loop, which SpotifyClient takes care of.
+        connector = aiohttp.TCPConnector(
+            limit=limit,
+            limit_per_host=limit_per_host,
+            ttl_dns_cache=ttl_dns_cache,
+            keepalive_timeout=75,
+            enable_cleanup_closed=True,
+        )
+        self._session: aiohttp.ClientSession = aiohttp.ClientSession(
+            connector=connector
+        )
+        log.debug("Created HTTP Session")
+
+        self._access_token: Optional[str] = None
+        # Already expired until the first token is received, so that a failed
+        # authorization is retried instead of leaving no expiry at all
+        self._expires_at: datetime = datetime.fromtimestamp(0, timezone.utc)
+        # Rebuilt only when the token changes, every request reuses the same dict
+        self._auth_headers: Dict[str, str] = {}
+
+        # Bounds the number of requests in flight, so bursts don't run into the rate limit.
+        # Every request goes to the same host, so by default as many as it gets connections.
+        if max_concurrency is None:
+            # 0 means no limit for the connector, and then for the requests as well
+            max_concurrency = limit_per_host or limit or sys.maxsize
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrency)
+        # time.monotonic() until which every request waits because of a rate limit (429)
+        self._retry_at: float = 0.0
+
+        # Raw bodies of the GET responses by Route.key, with the time.monotonic() they
+        # expire at. Ordered from the least to the most recently used. The bodies are
+        # decoded again on every hit, so that every caller gets a response of its own
+        # and modifying it can't change what later requests get.
+        self._cache: Dict[str, Tuple[float, bytes]] = {}
+        self._cache_ttl: float = cache_ttl
+        self._cache_size: int = cache_size
+        # Tasks of the GET requests in flight by Route.key, shared by identical requests.
+        # They return the raw body as well, which each of the waiters decodes.
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Number of callers waiting on each of these tasks
+        self._inflight_waiters: Dict[asyncio.Task, int] = {}
+
+        # Guards authorize only, requests themselves run concurrently on the pooled connections.
+        # The lock binds itself to the running loop on first use.
+        self.lock: asyncio.Lock = asyncio.Lock()
 
     async def request(self, route: Route) -> RESPONSE:
         """The base method to make all requests. This method do not handle login/authorization"""
 
-        if not hasattr(
-            self, "session"
+        if (
+            self._access_token is None
         ):  # User didn't call authorize before making request
             log.critical(
                 "Unauthorized - client should be authorized before making any requests to the API"
@@ -106,27 +318,89 @@ class HTTPClient:
 
         method = route.method
         url = route.url
+
+        if method != "GET":
+            return _decode(await self._request(route, None))
+
+        key = route.key
+        if self._cache_size > 0:
+            cached = self._cache.pop(key, None)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self._cache[key] = cached  # Move it to the most recently used end
+                    log.debug("Using the cached response of %s %s", method, url)
+                    return _decode(cached[1])
+
+        # Identical GETs made while one is already in flight share its response,
+        # instead of each one of them making the same request.
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._request(route, key))
+            inflight.add_done_callback(functools.partial(self._clear_inflight, key))
+            self._inflight[key] = inflight
+        else:
+            log.debug("Waiting on the in-flight request of %s %s", method, url)
+
+        waiters = self._inflight_waiters
+        waiters[inflight] = waiters.get(inflight, 0) + 1
+        try:
+            body = await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # The request goes on for the other waiters, unless this was the last one
+            if not inflight.done():
+                waiters[inflight] -= 1
+                if not waiters[inflight]:
+                    # Forget it right away, so that a request made before its done
+                    # callback runs starts a new one instead of joining the cancelled one
+                    if self._inflight.get(key) is inflight:
+                        del self._inflight[key]
+                    inflight.cancel()
+            raise
+        return _decode(body)
+
+    def _clear_inflight(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        self._inflight_waiters.pop(task, None)
+        retrieve_exception(task)
+
+    async def _request(self, route: Route, key: Optional[str]) -> bytes:
+        # Makes the request itself and returns the raw body of the response,
+        # which is cached under the key if one's given
+        method = route.method
+        url = route.url
         params = route.params
 
-        # Check if the access_token expired or not. If yes, authorize again
-        if (
-            datetime.datetime.utcnow() - self._expires_at
-        ).seconds <= 10:  # 10 second extra delay
-            await self.authorize()
+        session = self._session
 
-        headers: Dict[str, str] = {"Authorization": f"Bearer {self._access_token}"}
+        if datetime.now(timezone.utc) >= self._expires_at - self.EXPIRY_MARGIN:
+            # The token is (almost) expired, the request can't be made without a new one
+            await self.authorize()
 
-        async with self.lock:
-            try_auth_count = 0  # We try to authorize 2 times in case we receive 401 (Unauthorized) # fmt: off
+        # We try to authorize 2 times in case we receive 401 (Unauthorized),
+        # and make the request 5 times in case we receive 429 (Rate Limited)
+        try_auth_count = 0
+        rate_limit_count = 0
+
+        # Both of them are retried by looping, each with its own count, so that
+        # re-authorizing doesn't use up the tries for the rate limits or the other way round.
+        while True:
+            async with self._semaphore:
+                # When any request gets rate limited, all of them wait for the Retry-After
+                # period instead of each one hitting the 429 by itself. It's checked once
+                # the slot is acquired, so that the requests queued on the semaphore also
+                # wait for a back-off that started while they were queued.
+                while (delay := self._retry_at - time.monotonic()) > 0:
+                    await asyncio.sleep(delay)
+                    log.debug("Done sleeping for the rate limit. Retrying...")
 
-            # If we get rate limited, try 5 more times after sleep.
-            # If we're unauthorized, the same loop handles and tries to authorize twice
-            for _ in range(5):
                 log.debug(
                     "Dispatching %s request on %s with params %s", method, url, params
                 )
-                async with self.session.request(
-                    method, url, headers=headers, params=params
+                # Read on every try, so that a retry after re-authorizing sends the new token
+                token = self._access_token
+                async with session.request(
+                    method, url, headers=self._auth_headers, params=params
                 ) as response:
                     log.debug(
                         "%s on %s with params %s has responded with %s",
@@ -137,156 +411,199 @@ class HTTPClient:
                     )
 
                     if response.status == 429:  # Rate Limited
-                        return_headers = response.headers
-                        retry_after: float = float(return_headers["Retry-After"])
+                        retry_after: float = float(
+                            response.headers.get("Retry-After", 1)
+                        )
                         log.warning(
                             "We are getting rate limited. Retrying in %s seconds.",
                             retry_after,
                         )
 
-                        await asyncio.sleep(retry_after)
-                        log.debug("Done sleeping for the rate limit. Retrying...")
+                        self._retry_at = max(
+                            self._retry_at, time.monotonic() + retry_after
+                        )
+                        # The body isn't needed, but reading it lets the connection go back to the pool
+                        await response.read()
 
-                        continue  # let the loop continue and request again
+                        rate_limit_count += 1
+                        if rate_limit_count >= 5:
+                            break
+                        continue  # let the loop continue, wait and request again
 
                     else:
-                        data: Dict[str, Any] = await response.json(
-                            encoding="utf-8", loads=_from_json
-                        )
+                        body = await response.read()
 
                         if 200 <= response.status < 300:  # Successful
                             log.debug(
-                                "Received data from (%s) %s: %s", method, url, data
+                                "Received data from (%s) %s: %s", method, url, body
                             )
-                            return data
+                            if key is not None and self._cache_size > 0:
+                                self._store_in_cache(route, key, body)
+                            return body
 
                         elif (
                             response.status == 401
                         ):  # Unauthorized (Reauthorize and try again)
-                            # We try twice to authorize (the same loop for ratelimit handling handles this too)
-                            if try_auth_count < 2:
-                                await self.authorize()
-                                try_auth_count += 1
-                                continue
-                            else:
+                            if try_auth_count >= 2:
                                 # If we're here, this means we failed to authorize twice
                                 raise NotAuthorized(
                                     "Failed to Authorize while trying to make request"
                                 )
+                            try_auth_count += 1
 
-                        elif response.status == 403:
-                            log.error("%s Forbidden - %s", response.status, data)
-                            raise Forbidden(data, response.status)
-
-                        elif response.status == 404:
-                            log.error("%s Not Found - %s", response.status, data)
-                            raise NotFound(data, response.status)
+                        else:
+                            data = _error_data(response, body)
 
-                        elif response.status in {500, 502, 503}:
-                            log.critical("%s Server Error - %s", response.status, data)
-                            raise ServerError(data, response.status)
+                            if response.status == 403:
+                                log.error("%s Forbidden - %s", response.status, data)
+                                raise Forbidden(data, response.status)
 
-                        elif response.status in {304, 400}:
-                            log.error("%s HTTP Exception - %s", response.status, data)
-                            raise HTTPException(data, response.status)
+                            elif response.status == 404:
+                                log.error("%s Not Found - %s", response.status, data)
+                                raise NotFound(data, response.status)
 
-            # If we're here, then probably we failed to handle the rate limit 5 times
-            # Or we missed handling some error code (probably not)
-            _error = {  # We don't have any native data to supply, so construct one ourselves # fmt: off
-                "error": "Rate Limited",
-                "error_description": "You are being rate limited. Try again later",
-            }
-            raise HTTPException(_error, 429, "Failed to handle rate limits.")
+                            elif response.status in {500, 502, 503}:
+                                log.critical(
+                                    "%s Server Error - %s", response.status, data
+                                )
+                                raise ServerError(data, response.status)
 
-    async def authorize(self) -> None:
+                            else:
+                                log.error(
+                                    "%s HTTP Exception - %s", response.status, data
+                                )
+                                raise HTTPException(data, response.status)
+
+            # Only a 401 gets here. Authorize once the connection and the
+            # semaphore are released, then loop to make the request again.
+            await self.authorize(token)
+
+        # If we're here, then we failed to handle the rate limit 5 times
+        _error = {  # We don't have any native data to supply, so construct one ourselves # fmt: off
+            "error": "Rate Limited",
+            "error_description": "You are being rate limited. Try again later",
+        }
+        raise HTTPException(_error, 429, "Failed to handle rate limits.")
+
+    def _store_in_cache(self, route: Route, key: str, body: bytes) -> None:
+        if route.path in self.PERMANENT_PATHS:
+            expires_at = math.inf
+        else:
+            expires_at = time.monotonic() + self._cache_ttl
+
+        if len(self._cache) >= self._cache_size:
+            # Evict the least recently used response
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (expires_at, body)
+
+    async def authorize(self, rejected_token: Optional[str] = None) -> None:
         """Authorize to the API and gets the Authorization Token to make requests.
         This method must be called before making any requests to the API, else it'll result to unhandled Exceptions.
-        """
 
-        if not hasattr(self, "session"):
-            self.session = aiohttp.ClientSession(loop=self.loop)
-            log.debug("Created HTTP Session")
-
-        auth_url: str = self.ACCOUNT_BASE + "token/"
-        body = {"grant_type": "client_credentials"}
-        encoded: bytes = base64.b64encode(
-            six.text_type(self.client_id + ":" + self.client_secret).encode("ascii")
-        )
-        headers: Dict[str, str] = {"Authorization": f'Basic {encoded.decode("ascii")}'}
+        Parameters
+        -----------
+        rejected_token: Optional[:class:`str`]
+            The token a request was rejected with. Nothing is done if the token has
+            been refreshed since. Defaults to the current token.
+        """
 
-        log.info("Logging in with client credentials")
-        response = aiohttp.ClientResponse = await self.session.post(
-            auth_url, headers=headers, data=body
-        )
-        data: Dict[str, Any] = await response.json()
+        # The token to replace, to know if it got refreshed in the meantime
+        if rejected_token is None:
+            rejected_token = self._access_token
 
-        try:
-            assert response.status == 200  # Successful
-            self._access_token = data["access_token"]
-            self._expires_at = datetime.datetime.utcnow() + datetime.timedelta(
-                seconds=data["expires_in"]
-            )
-            log.info("200 - Authorization Successful")
-            return
-
-        except AssertionError:
-            if response.status in {
-                201,
-                202,
-                204,
-                304,
-                401,
-                404,
-            }:  # TODO: Idk in what cases it raises exceptions (maybe later)
-                log.error("Received %s with %s on authorization", response.status, data)
+        async with self.lock:
+            if self._access_token != rejected_token:
+                # Some other call already refreshed the token, no need to do it again
                 return
 
-            if response.status == 400:
-                log.critical(
-                    "Received %s while trying to authorize: %s", response.status, data
+            auth_url: str = self.ACCOUNT_BASE + "token/"
+
+            log.info("Logging in with client credentials")
+            async with self._session.post(
+                auth_url, headers=self._token_headers, data=self.TOKEN_BODY
+            ) as response:
+                body = await response.read()
+
+            if response.status == 200:
+                data: Union[RESPONSE, str] = _from_json(body)
+            else:
+                data = _error_data(response, body)
+
+            try:
+                assert response.status == 200  # Successful
+                self._access_token = data["access_token"]
+                self._auth_headers = {"Authorization": f"Bearer {self._access_token}"}
+                self._expires_at = datetime.now(timezone.utc) + timedelta(
+                    seconds=data["expires_in"]
                 )
-                raise InvalidClientCredentials(data, response.status)
+                log.info("200 - Authorization Successful")
+                return
 
-            if response.status == 403:
-                raise HTTPException(data, response.status)
+            except AssertionError:
+                if response.status in {
+                    201,
+                    202,
+                    204,
+                    304,
+                    401,
+                    404,
+                }:  # TODO: Idk in what cases it raises exceptions (maybe later)
+                    log.error(
+                        "Received %s with %s on authorization", response.status, data
+                    )
+                    return
 
-            if response.status in {500, 502, 503}:  # server error
-                log.critical(
-                    "Server Error: Received %s while trying to authorize: %s",
-                    response.status,
-                    data,
-                )
-                raise ServerError(data, response.status)
+                if response.status == 400:
+                    log.critical(
+                        "Received %s while trying to authorize: %s",
+                        response.status,
+                        data,
+                    )
+                    raise InvalidClientCredentials(data, response.status)
+
+                if response.status == 403:
+                    raise HTTPException(data, response.status)
+
+                if response.status in {500, 502, 503}:  # server error
+                    log.critical(
+                        "Server Error: Received %s while trying to authorize: %s",
+                        response.status,
+                        data,
+                    )
+                    raise ServerError(data, response.status)
+
+    @property
+    def expires_in(self) -> float:
+        """Seconds left before the current access token expires"""
+        return (self._expires_at - datetime.now(timezone.utc)).total_seconds()
 
     async def destroy(self) -> None:
         """Destroys and cleans the sessions"""
 
-        if self.session and not self.session.closed:
-            await self.session.close()
+        for task in self._inflight.values():
+            task.cancel()
+        self._inflight.clear()
+        self._inflight_waiters.clear()
+
+        if not self._session.closed:
+            await self._session.close()
             log.debug("Closed session")
 
     # Albums API (https://developer.spotify.com/documentation/web-api/reference/#category-albums)
 
+    @endpoint("GET", "albums", lists=("ids",))
     async def get_multiple_albums(
         self, ids: List[ID], *, market: Optional[MARKETS] = None
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-multiple-albums
+        ...
 
-        params: PARAMS = {"ids": ",".join(id for id in ids)}
-        if market:
-            params["market"] = market
-
-        return await self.request(Route("GET", "albums", params))
-
+    @endpoint("GET", "albums/{id}")
     async def get_album(self, id: ID, *, market: Optional[MARKETS] = None) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-an-album
+        ...
 
-        params: PARAMS = {}
-        if market:
-            params["market"] = market
-
-        return await self.request(Route("GET", f"albums/{id}", params))
-
+    @endpoint("GET", "albums/{id}/tracks")
     async def get_album_tracks(
         self,
         id: ID,
@@ -296,40 +613,31 @@ class HTTPClient:
         offset: Optional[int] = 0,
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-an-albums-tracks
-
-        params: PARAMS = {}
-        if market:
-            params["market"] = market
-        params["limit"] = limit
-        params["offset"] = offset
-
-        return await self.request(Route("GET", f"albums/{id}/tracks", params))
+        ...
 
     # Artists API (https://developer.spotify.com/documentation/web-api/reference/#category-artists)
 
+    @endpoint("GET", "artists", lists=("ids",))
     async def get_multiple_artists(self, ids: List[ID]) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-multiple-artists
+        ...
 
-        params: PARAMS = {"ids": ",".join(id for id in ids)}
-
-        return await self.request(Route("GET", "artists", params))
-
+    @endpoint("GET", "artists/{id}")
     async def get_artist(self, id: ID) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-an-artist
+        ...
 
-        return await self.request(Route("GET", f"artists/{id}"))
-
+    @endpoint("GET", "artists/{id}/top-tracks")
     async def get_artist_top_tracks(self, id: ID, *, market: MARKETS) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-an-artists-top-tracks
+        ...
 
-        params: PARAMS = {"market": market}
-        return await self.request(Route("GET", f"artists/{id}/top-tracks", params))
-
+    @endpoint("GET", "artists/{id}/related-artists")
     async def get_artist_related_artists(self, id: ID) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-an-artists-related-artists
+        ...
 
-        return await self.request(Route("GET", f"artists/{id}/related-artists"))
-
+    @endpoint("GET", "artists/{id}/albums", lists=("include_groups",))
     async def get_artist_albums(
         self,
         id: ID,
@@ -342,20 +650,11 @@ class HTTPClient:
         offset: Optional[int] = 0,
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-an-artists-albums
-
-        params: PARAMS = {}
-
-        if include_groups:
-            params["include_groups"] = ",".join(group for group in include_groups)
-        if market:
-            params["market"] = market
-        params["limit"] = limit
-        params["offset"] = offset
-
-        return await self.request(Route("GET", f"artists/{id}/albums", params))
+        ...
 
     # Browse API (https://developer.spotify.com/documentation/web-api/reference/#category-browse)
 
+    @endpoint("GET", "browse/new-releases")
     async def get_all_new_releases(
         self,
         *,
@@ -364,16 +663,9 @@ class HTTPClient:
         offset: Optional[int] = 0,
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-new-releases
+        ...
 
-        params: PARAMS = {}
-
-        if country:
-            params["country"] = country
-        params["limit"] = limit
-        params["offset"] = offset
-
-        return await self.request(Route("GET", "browse/new-releases", params))
-
+    @endpoint("GET", "browse/featured-playlists")
     async def get_all_featured_playlists(
         self,
         *,
@@ -384,19 +676,9 @@ class HTTPClient:
         offset: Optional[int] = 0,
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-featured-playlists
+        ...
 
-        params: PARAMS = {}
-        if country:
-            params["country"] = country
-        if locale:
-            params["locale"] = locale
-        if timestamp:
-            params["timestamp"] = timestamp
-        params["limit"] = limit
-        params["offset"] = offset
-
-        return await self.request(Route("GET", "browse/featured-playlists", params))
-
+    @endpoint("GET", "browse/categories")
     async def get_all_categories(
         self,
         *,
@@ -406,17 +688,9 @@ class HTTPClient:
         offset: Optional[int] = 0,
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-categories
+        ...
 
-        params: PARAMS = {}
-        if country:
-            params["country"] = country
-        if locale:
-            params["locale"] = locale
-        params["limit"] = limit
-        params["offset"] = offset
-
-        return await self.request(Route("GET", "browse/categories", params))
-
+    @endpoint("GET", "browse/categories/{category_id}")
     async def get_category(
         self,
         category_id: ID,
@@ -425,17 +699,9 @@ class HTTPClient:
         locale: Optional[str] = None,
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-a-category
+        ...
 
-        params: PARAMS = {}
-        if country:
-            params["country"] = country
-        if locale:
-            params["locale"] = locale
-
-        return await self.request(
-            Route("GET", f"browse/categories/{category_id}", params)
-        )
-
+    @endpoint("GET", "browse/categories/{category_id}/playlists")
     async def get_category_playlists(
         self,
         category_id: ID,
@@ -445,17 +711,9 @@ class HTTPClient:
         offset: Optional[int] = 0,
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-a-categories-playlists
+        ...
 
-        params: PARAMS = {}
-        if country:
-            params["country"] = country
-        params["limit"] = limit
-        params["offset"] = offset
-
-        return await self.request(
-            Route("GET", f"browse/categories/{category_id}/playlists", params)
-        )
-
+    @endpoint("GET", "recommendations", lists=("seed_artists", "seed_genres", "seed_tracks"))
     async def get_recommendations(
         self,
         *,
@@ -508,113 +766,48 @@ class HTTPClient:
         target_valence: Optional[float] = None,
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-recommendations
+        ...
 
-        params: PARAMS = {}
-        params["seed_artists"] = seed_artists
-        params["seed_genres"] = seed_genres
-        params["seed_tracks"] = seed_tracks
-        params["limit"] = limit
-        params["market"] = market
-        params["min_acousticness"] = min_acousticness
-        params["max_acousticness"] = max_acousticness
-        params["target_acousticness"] = target_acousticness
-        params["min_danceability"] = min_danceability
-        params["max_danceability"] = max_danceability
-        params["target_danceability"] = target_danceability
-        params["min_duration_ms"] = min_duration_ms
-        params["max_duration_ms"] = max_duration_ms
-        params["target_duration_ms"] = target_duration_ms
-        params["min_energy"] = min_energy
-        params["max_energy"] = max_energy
-        params["target_energy"] = target_energy
-        params["min_instrumentalness"] = min_instrumentalness
-        params["max_instrumentalness"] = max_instrumentalness
-        params["target_instrumentalness"] = target_instrumentalness
-        params["min_key"] = min_key
-        params["max_key"] = max_key
-        params["target_key"] = target_key
-        params["min_liveness"] = min_liveness
-        params["max_liveness"] = max_liveness
-        params["target_liveness"] = target_liveness
-        params["min_loudness"] = min_loudness
-        params["max_loudness"] = max_loudness
-        params["target_loudness"] = target_loudness
-        params["min_mode"] = min_mode
-        params["max_mode"] = max_mode
-        params["target_mode"] = target_mode
-        params["min_popularity"] = min_popularity
-        params["max_popularity"] = max_popularity
-        params["target_popularity"] = target_popularity
-        params["min_speechiness"] = min_speechiness
-        params["max_speechiness"] = max_speechiness
-        params["target_speechiness"] = target_speechiness
-        params["min_tempo"] = min_tempo
-        params["max_tempo"] = max_tempo
-        params["target_tempo"] = target_tempo
-        params["min_time_signature"] = min_time_signature
-        params["max_time_signature"] = max_time_signature
-        params["target_time_signature"] = target_time_signature
-        params["min_valence"] = min_valence
-        params["max_valence"] = max_valence
-
-        for key, value in params.items():
-            if value is None:
-                params.pop(key)
-
-        return await self.request(Route("GET", "recommendations", params))
-
+    @endpoint("GET", "recommendations/available-genre-seeds")
     async def get_recommendation_genres(self) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-recommendation-genres
-
-        return await self.request(Route("GET", "recommendations/available-genre-seeds"))
+        ...
 
     # Episodes API (https://developer.spotify.com/documentation/web-api/reference/#category-episodes)
 
+    @endpoint("GET", "episodes", lists=("ids",))
     async def get_multiple_episodes(
         self, ids: List[ID], *, market: Optional[MARKETS] = None
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-multiple-episodes
+        ...
 
-        params: PARAMS = {}
-        if market:
-            params["market"] = market
-
-        return await self.request(Route("GET", "episodes", params))
-
+    @endpoint("GET", "episodes/{id}")
     async def get_episode(
         self, id: ID, *, market: Optional[MARKETS] = None
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-an-episode
-
-        params: PARAMS = {}
-        if market:
-            params["market"] = market
-
-        return await self.request(Route("GET", f"episodes/{id}", params))
+        ...
 
     # Follow API (https://developer.spotify.com/documentation/web-api/reference/#category-follow)
     # All routes are not covered since they can't be accessed with Client Credentials Grant
 
+    @endpoint("GET", "playlists/{playlist_id}/followers/contains", lists=("ids",))
     async def check_if_users_follow_playlist(
         self, playlist_id: ID, ids: List[ID]
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-check-if-user-follows-playlist
-
-        params: PARAMS = {"ids": ",".join(id for id in ids)}
-
-        return await self.request(
-            Route("GET", f"playlists/{playlist_id}/followers/contains", params)
-        )
+        ...
 
     # Library API (https://developer.spotify.com/documentation/web-api/reference/#category-library)
     # No routes are covered  for this endpoint since none of them can't be accessed with Client Credentials Grant
 
     # Markets API (https://developer.spotify.com/documentation/web-api/reference/#category-markets)
 
+    @endpoint("GET", "markets")
     async def get_available_markets(self) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-available-markets
-
-        return await self.request(Route("GET", "markets"))
+        ...
 
     # Personalization API (https://developer.spotify.com/documentation/web-api/reference/#category-personalization)
     # No routes are covered  for this endpoint since none of them can't be accessed with Client Credentials Grant
@@ -624,15 +817,14 @@ class HTTPClient:
 
     # Playlists API (https://developer.spotify.com/documentation/web-api/reference/#category-playlists)
 
+    @endpoint("GET", "users/{user_id}/playlists")
     async def get_user_playlists(
         self, user_id: ID, *, limit: Optional[int] = 20, offset: Optional[int] = 0
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-list-users-playlists
+        ...
 
-        params: PARAMS = {"limit": limit, "offset": offset}
-
-        return await self.request(Route("GET", f"users/{user_id}/playlists", params))
-
+    @endpoint("GET", "playlists/{playlist_id}", lists=("additional_types",))
     async def get_playlist(
         self,
         playlist_id: ID,
@@ -642,17 +834,9 @@ class HTTPClient:
         additional_types: Optional[List[Literal["track", "episode"]]] = None,
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-playlist
+        ...
 
-        params: PARAMS = {}
-        if market:
-            params["market"] = market
-        if fields:
-            params["fields"] = fields
-        if additional_types:
-            params["additional_types"] = ",".join(t for t in additional_types)
-
-        return await self.request(Route("GET", f"playlists/{playlist_id}", params))
-
+    @endpoint("GET", "playlists/{playlist_id}/tracks", lists=("additional_types",))
     async def get_playlist_items(
         self,
         playlist_id: ID,
@@ -664,23 +848,11 @@ class HTTPClient:
         additional_types: Optional[List[Literal["track", "episode"]]] = None,
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-playlists-tracks
-
-        params: PARAMS = {}
-        if market:
-            params["market"] = market
-        params["limit"] = limit
-        params["offset"] = offset
-        if fields:
-            params["fields"] = fields
-        if additional_types:
-            params["additional_types"] = ",".join(t for t in additional_types)
-
-        return await self.request(
-            Route("GET", f"playlists/{playlist_id}/tracks", params)
-        )
+        ...
 
     # Search API (https://developer.spotify.com/documentation/web-api/reference/#category-search)
 
+    @endpoint("GET", "search", aliases={"query": "q", "_type": "type"})
     async def search(
         self,
         query: str,
@@ -692,39 +864,23 @@ class HTTPClient:
         include_external: Optional[Literal["audio"]] = None,
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-search
-
-        params: PARAMS = {"query": query.replace(" ", "+"), "type": _type}
-        if market:
-            params["market"] = market
-        params["limit"] = limit
-        params["offset"] = offset
-        if include_external:
-            params["include_external"] = include_external
-
-        return await self.request(Route("GET", "search", params))
+        ...
 
     # Shows API (https://developer.spotify.com/documentation/web-api/reference/#category-shows)
 
+    @endpoint("GET", "shows", lists=("ids",))
     async def get_shows(
         self, ids: List[ID], *, market: Optional[MARKETS] = None
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#category-shows
+        ...
 
-        params: PARAMS = {"ids": ",".join(id for id in ids)}
-        if market:
-            params["market"] = market
-
-        return await self.request(Route("GET", "shows", params))
-
+    @endpoint("GET", "shows/{id}")
     async def get_show(self, id: ID, *, market: Optional[MARKETS] = None) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-a-show
+        ...
 
-        params: PARAMS = {}
-        if market:
-            params["market"] = market
-
-        return await self.request(Route("GET", f"shows/{id}", params))
-
+    @endpoint("GET", "shows/{id}/episodes")
     async def get_show_episodes(
         self,
         id: ID,
@@ -734,57 +890,40 @@ class HTTPClient:
         offset: Optional[int] = 0,
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-a-shows-episodes
-
-        params: PARAMS = {}
-        if market:
-            params["market"] = market
-        params["limit"] = limit
-        params["offset"] = offset
-
-        return await self.request(Route("GET", f"shows/{id}/episodes", params))
+        ...
 
     # Tracks API (https://developer.spotify.com/documentation/web-api/reference/#category-tracks)
 
+    @endpoint("GET", "tracks", lists=("ids",))
     async def get_tracks(
         self, ids: List[ID], *, market: Optional[MARKETS] = None
     ) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-several-tracks
+        ...
 
-        params: PARAMS = {"ids": ",".join(id for id in ids)}
-        if market:
-            params["market"] = market
-
-        return await self.request(Route("GET", "tracks", params))
-
+    @endpoint("GET", "tracks/{id}")
     async def get_track(self, id: ID, *, market: Optional[MARKETS] = None) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-track
+        ...
 
-        params: PARAMS = {}
-        if market:
-            params["market"] = market
-
-        return await self.request(Route("GET", f"tracks/{id}", params))
-
+    @endpoint("GET", "audio-features", lists=("ids",))
     async def get_audio_features_of_tracks(self, ids: List[ID]) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-several-audio-features
+        ...
 
-        params: PARAMS = {"ids": ",".join(id for id in ids)}
-
-        return await self.request(Route("GET", "audio-features", params))
-
+    @endpoint("GET", "audio-features/{id}")
     async def get_audio_features_of_track(self, id: ID) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-audio-features
+        ...
 
-        return await self.request(Route("GET", f"audio-features/{id}"))
-
+    @endpoint("GET", "audio-analysis/{id}")
     async def get_audio_analysis_of_track(self, id: ID) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-audio-analysis
-
-        return await self.request(Route("GET", f"audio-analysis/{id}"))
+        ...
 
     # Users Profile API (https://developer.spotify.com/documentation/web-api/reference/#category-users-profile)
 
+    @endpoint("GET", "users/{user_id}")
     async def get_user_profile(self, user_id: ID) -> RESPONSE:
         # https://developer.spotify.com/documentation/web-api/reference/#endpoint-get-users-profile
-
-        return await self.request(Route("GET", f"users/{user_id}"))
+        ...
@@ -23,7 +23,7 @@ SOFTWARE.
 """
 
 from __future__ import annotations
-from typing import Any, Dict, Literal
+from typing import Any, Dict, List, Literal, Tuple
 
 
 URI = str
@@ -33,7 +33,7 @@ ID = str
 URL = str
 
 RESPONSE = Dict[str, Any]
-PARAMS = Dict[str, Any]
+PARAMS = List[Tuple[str, str]]
 
 MARKETS = Literal[
     "AF",
@@ -0,0 +1,107 @@
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import pytest
+
+import aiospotify.http
+from aiospotify.http import HTTPClient
+
+
+class StubResponse:
+    """Stands in for an aiohttp response, with the body given upfront"""
+
+    def __init__(
+        self,
+        status: int = 200,
+        body: Any = None,
+        *,
+        reason: str = "OK",
+        headers: Optional[Dict[str, str]] = None,
+        delay: float = 0,
+    ) -> None:
+        self.status = status
+        self.reason = reason
+        self.headers = headers or {}
+        if body is None:
+            self.body = b""
+        elif isinstance(body, bytes):
+            self.body = body
+        else:
+            self.body = json.dumps(body).encode()
+        self.delay = delay
+
+    async def read(self) -> bytes:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self.body
+
+    async def __aenter__(self) -> "StubResponse":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        pass
+
+
+Handler = Callable[[str, str, Dict[str, str]], StubResponse]
+
+
+class StubSession:
+    """Stands in for the aiohttp session, answering every request with ``handler``.
+
+    The requests made are recorded as (method, url, params) in ``requests``.
+    """
+
+    def __init__(self, handler: Optional[Handler] = None) -> None:
+        self.handler = handler or (lambda method, url, params: StubResponse(200, {}))
+        self.requests: List[Tuple[str, str, Dict[str, str]]] = []
+        # The headers each of the requests was sent with
+        self.headers: List[Dict[str, str]] = []
+        # Answers to the token requests, in order, then default_token_response
+        self.token_responses: List[StubResponse] = []
+        self.default_token_response = StubResponse(
+            200, {"access_token": "token", "expires_in": 3600}
+        )
+        self.token_requests = 0
+        self.closed = False
+
+    def request(
+        self, method: str, url: Any, *, headers: Any = None, params: Any = None
+    ) -> StubResponse:
+        url = str(url).split("?")[0]
+        params = dict(params or ())
+        self.requests.append((method, url, params))
+        self.headers.append(dict(headers or {}))
+        return self.handler(method, url, params)
+
+    def post(self, url: str, *, headers: Any = None, data: Any = None) -> StubResponse:
+        self.token_requests += 1
+        if self.token_responses:
+            return self.token_responses.pop(0)
+        return self.default_token_response
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> StubSession:
+    """The session every HTTPClient created in the test gets"""
+    stub = StubSession()
+    monkeypatch.setattr(
+        aiospotify.http.aiohttp, "ClientSession", lambda **kwargs: stub
+    )
+    monkeypatch.setattr(aiospotify.http.aiohttp, "TCPConnector", lambda **kwargs: None)
+    return stub
+
+
+@pytest.fixture
+def make_http(session: StubSession) -> Callable[..., Awaitable[HTTPClient]]:
+    """Creates an authorized HTTPClient using the stub session, in the running loop"""
+
+    async def make(**options: Any) -> HTTPClient:
+        http = HTTPClient("Basic Y2xpZW50OnNlY3JldA==", **options)
+        await http.authorize()
+        return http
+
+    return make
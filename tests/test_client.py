@@ -0,0 +1,275 @@
+import asyncio
+
+import pytest
+
+from aiospotify import HTTPException, NotFound, ServerError, SpotifyClient
+from conftest import StubResponse
+
+INVALID_ID = {"error": {"status": 400, "message": "invalid id"}}
+
+
+def tracks_handler(method, url, params):
+    ids = params["ids"].split(",")
+    if "bad" in ids:
+        return StubResponse(400, INVALID_ID)
+    return StubResponse(
+        200, {"tracks": [None if id == "missing" else {"id": id} for id in ids]}
+    )
+
+
+def test_get_track_batches_concurrent_lookups(session):
+    session.handler = tracks_handler
+
+    async def main():
+        async with SpotifyClient("client", "secret") as client:
+            return await asyncio.gather(
+                client.get_track("a"), client.get_track("b"), client.get_track("a")
+            )
+
+    a, b, a_again = asyncio.run(main())
+
+    assert session.requests == [
+        ("GET", "https://api.spotify.com/v1/tracks", {"ids": "a,b"})
+    ]
+    assert a == a_again == {"id": "a"}
+    assert a is not a_again  # Each caller gets a track of its own
+    assert b == {"id": "b"}
+
+
+def test_get_track_splits_a_batch_with_an_invalid_id(session):
+    session.handler = tracks_handler
+
+    async def main():
+        async with SpotifyClient("client", "secret") as client:
+            return await asyncio.gather(
+                *(client.get_track(id) for id in ("a", "b", "bad", "c", "missing")),
+                return_exceptions=True,
+            )
+
+    a, b, bad, c, missing = asyncio.run(main())
+
+    assert (a, b, c) == ({"id": "a"}, {"id": "b"}, {"id": "c"})
+    assert isinstance(bad, HTTPException) and bad.status_code == 400
+    assert isinstance(missing, NotFound)
+
+
+def test_get_track_doesnt_split_other_bad_requests(session):
+    session.handler = lambda method, url, params: StubResponse(
+        400, {"error": {"status": 400, "message": "Invalid market code"}}
+    )
+
+    async def main():
+        async with SpotifyClient("client", "secret") as client:
+            return await asyncio.gather(
+                *(client.get_track(f"id{i}", market="XX") for i in range(50)),
+                return_exceptions=True,
+            )
+
+    errors = asyncio.run(main())
+
+    assert len(session.requests) == 1
+    assert all(isinstance(exc, HTTPException) for exc in errors)
+    # Every caller gets an exception of its own
+    assert len({id(exc) for exc in errors}) == 50
+
+
+def test_cancelling_one_caller_keeps_the_lookup_for_the_others(session):
+    session.handler = lambda method, url, params: StubResponse(
+        200, {"tracks": [{"id": "a"}]}, delay=0.01
+    )
+
+    async def main():
+        async with SpotifyClient("client", "secret") as client:
+            first = asyncio.ensure_future(client.get_track("a"))
+            second = asyncio.ensure_future(client.get_track("a"))
+            await asyncio.sleep(0)
+            first.cancel()
+
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            return await second
+
+    assert asyncio.run(main()) == {"id": "a"}
+    assert len(session.requests) == 1
+
+
+def token(access_token, expires_in, delay=0):
+    return StubResponse(
+        200, {"access_token": access_token, "expires_in": expires_in}, delay=delay
+    )
+
+
+def test_token_is_refreshed_before_it_expires(session, monkeypatch):
+    monkeypatch.setattr(SpotifyClient, "REFRESH_MARGIN", 0.1)
+    session.token_responses.extend([token("first", 0.2), token("second", 3600)])
+
+    async def main():
+        client = SpotifyClient("client", "secret")
+        await client.authorize()
+        await asyncio.sleep(0.15)
+        access_token = client.http._access_token
+        await client.close()
+        return access_token
+
+    assert asyncio.run(main()) == "second"
+    assert session.token_requests == 2
+
+
+def test_refresh_backs_off_when_the_token_is_unchanged(session, monkeypatch):
+    monkeypatch.setattr(SpotifyClient, "REFRESH_MARGIN", 0.1)
+    monkeypatch.setattr(SpotifyClient, "REFRESH_RETRY_DELAY", 0.05)
+    session.token_responses.append(token("first", 0.05))
+    # Not an error HTTPClient.authorize raises for, it leaves the old token in place
+    session.default_token_response = StubResponse(
+        404, {"error": {"status": 404, "message": "not found"}}
+    )
+
+    async def main():
+        client = SpotifyClient("client", "secret")
+        await client.authorize()
+        await asyncio.sleep(0.12)
+        await client.close()
+
+    asyncio.run(main())
+
+    # The first token, then one try every REFRESH_RETRY_DELAY instead of a busy loop
+    assert 2 <= session.token_requests <= 4
+
+
+def test_concurrent_authorizations_share_one_token_request(session):
+    session.default_token_response = token("token", 3600, delay=0.01)
+
+    async def main():
+        client = SpotifyClient("client", "secret")
+        await asyncio.gather(*(client.authorize() for _ in range(5)))
+        await client.close()
+
+    asyncio.run(main())
+
+    assert session.token_requests == 1
+
+
+def test_nested_entries_close_on_the_outermost_exit(session):
+    async def main():
+        client = SpotifyClient("client", "secret")
+        async with client:
+            async with client:
+                pass
+            # Still open after the inner block exits
+            assert not client.http._session.closed
+
+    asyncio.run(main())
+
+    assert session.token_requests == 1
+    assert session.closed
+
+
+def test_client_is_reused_across_event_loops(session):
+    session.handler = tracks_handler
+    client = SpotifyClient("client", "secret")
+
+    async def main():
+        # Not closed, like a job that leaves the client to the next one
+        await client.authorize()
+        return client.http, await client.get_track("a")
+
+    first_http, first = asyncio.run(main())
+    second_http, second = asyncio.run(main())
+
+    assert first == second == {"id": "a"}
+    assert first_http is not second_http
+    # The state of the first, now closed, loop is pruned
+    assert len(client._loop_states) == 1
+
+
+SERVER_ERROR = StubResponse(500, {"error": {"status": 500, "message": "oops"}})
+
+
+def test_failed_enter_closes_its_own_session(session):
+    session.default_token_response = SERVER_ERROR
+
+    async def main():
+        client = SpotifyClient("client", "secret")
+        with pytest.raises(ServerError):
+            async with client:
+                pass
+        return client
+
+    client = asyncio.run(main())
+
+    assert session.closed
+    assert client._loop_states == {}
+
+
+def test_failed_enter_leaves_an_existing_state_open(session):
+    session.token_responses.append(token("short lived", 0.01))
+    session.default_token_response = SERVER_ERROR
+
+    async def main():
+        client = SpotifyClient("client", "secret")
+        await client.authorize()
+        http = client.http
+
+        # The token is about to expire, so entering requests a new one and fails
+        with pytest.raises(ServerError):
+            async with client:
+                pass
+
+        assert client.http is http
+        assert not session.closed
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_get_tracks_chunks_the_ids_and_keeps_their_order(session):
+    def handler(method, url, params):
+        ids = params["ids"].split(",")
+        # The later chunks answer first
+        delay = 0.03 if ids[0] == "0" else 0.01
+        return StubResponse(200, {"tracks": [{"id": id} for id in ids]}, delay=delay)
+
+    session.handler = handler
+    ids = [str(i) for i in range(120)]
+
+    async def main():
+        async with SpotifyClient("client", "secret", cache_size=0) as client:
+            return await client.get_tracks(ids)
+
+    tracks = asyncio.run(main())
+
+    assert [track["id"] for track in tracks] == ids
+    assert [len(params["ids"].split(",")) for _, _, params in session.requests] == [
+        50,
+        50,
+        20,
+    ]
+
+
+def test_get_tracks_cancels_the_other_chunks_when_one_fails(session):
+    finished = []
+
+    class SlowResponse(StubResponse):
+        async def read(self):
+            body = await super().read()
+            finished.append(self)
+            return body
+
+    def handler(method, url, params):
+        if params["ids"].startswith("0,"):
+            return StubResponse(404, {"error": {"status": 404, "message": "nope"}})
+        return SlowResponse(200, {"tracks": []}, delay=0.02)
+
+    session.handler = handler
+
+    async def main():
+        async with SpotifyClient("client", "secret", cache_size=0) as client:
+            with pytest.raises(NotFound):
+                await client.get_tracks([str(i) for i in range(120)])
+            # Long enough for the other chunks to have finished, had they kept running
+            await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+
+    assert len(session.requests) == 3
+    assert finished == []
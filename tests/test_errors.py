@@ -0,0 +1,48 @@
+import pickle
+
+from aiospotify.errors import HTTPException, NotFound, ServerError
+
+
+def test_regular_error_object():
+    exc = NotFound({"error": {"status": 404, "message": "non existing id"}}, 404)
+
+    assert str(exc) == "404: non existing id"
+    assert exc.status_code == 404
+    assert exc.error is None
+    assert exc.description == "non existing id"
+
+
+def test_authentication_error_object():
+    exc = HTTPException(
+        {"error": "invalid_client", "error_description": "Invalid client"}, 400
+    )
+
+    assert str(exc) == "400 invalid_client: Invalid client"
+    assert exc.error == "invalid_client"
+    assert exc.description == "Invalid client"
+
+
+def test_authentication_error_without_description():
+    exc = HTTPException({"error": "invalid_client"}, 400, "while authorizing")
+
+    assert str(exc) == "400 invalid_client (while authorizing)"
+    assert exc.description is None
+
+
+def test_preformatted_message_uses_the_default_status():
+    exc = ServerError("502 Bad Gateway: <html></html>")
+
+    assert str(exc) == "502 Bad Gateway: <html></html>"
+    assert exc.status_code == 500
+    assert exc.raw is None
+
+
+def test_fields_survive_pickling():
+    data = {"error": {"status": 404, "message": "non existing id"}}
+    exc = pickle.loads(pickle.dumps(NotFound(data, 404)))
+
+    assert type(exc) is NotFound
+    assert str(exc) == "404: non existing id"
+    assert exc.status_code == 404
+    assert exc.description == "non existing id"
+    assert exc.raw == data
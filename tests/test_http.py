@@ -0,0 +1,391 @@
+import asyncio
+
+import pytest
+
+from aiospotify.errors import HTTPException, NotAuthorized
+from aiospotify.http import Route, endpoint
+from conftest import StubResponse
+
+BASE = Route.BASE
+
+
+def test_get_recommendations_sends_only_the_set_params(session, make_http):
+    async def main():
+        http = await make_http()
+        await http.get_recommendations(
+            seed_artists=["a1", "a2"],
+            seed_genres=[],
+            seed_tracks=["t1"],
+            market="US",
+            min_energy=0.5,
+        )
+
+    asyncio.run(main())
+
+    assert session.requests == [
+        (
+            "GET",
+            BASE + "recommendations",
+            {
+                "seed_artists": "a1,a2",
+                "seed_tracks": "t1",
+                "limit": "20",
+                "market": "US",
+                "min_energy": "0.5",
+            },
+        )
+    ]
+
+
+def test_search_sends_the_query_as_q_and_type(session, make_http):
+    async def main():
+        http = await make_http()
+        await http.search("daft punk", "artist", limit=5)
+
+    asyncio.run(main())
+
+    assert session.requests == [
+        (
+            "GET",
+            BASE + "search",
+            {"q": "daft punk", "type": "artist", "limit": "5", "offset": "0"},
+        )
+    ]
+
+
+def test_get_multiple_episodes_joins_the_ids(session, make_http):
+    async def main():
+        http = await make_http()
+        await http.get_multiple_episodes(["e1", "e2", "e3"], market="DE")
+
+    asyncio.run(main())
+
+    assert session.requests == [
+        ("GET", BASE + "episodes", {"ids": "e1,e2,e3", "market": "DE"})
+    ]
+
+
+def test_path_arguments_are_formatted_into_the_url(session, make_http):
+    async def main():
+        http = await make_http()
+        await http.get_album_tracks("album_id", market="US")
+        await http.get_available_markets()
+
+    asyncio.run(main())
+
+    assert session.requests == [
+        (
+            "GET",
+            BASE + "albums/album_id/tracks",
+            {"market": "US", "limit": "20", "offset": "0"},
+        ),
+        ("GET", BASE + "markets", {}),
+    ]
+
+
+def test_falsy_values_are_sent(session, make_http):
+    async def main():
+        http = await make_http()
+        await http.get_recommendations(
+            seed_artists=["a1"],
+            seed_genres=[],
+            seed_tracks=[],
+            min_popularity=0,
+            target_valence=0.0,
+        )
+
+    asyncio.run(main())
+
+    params = session.requests[0][2]
+    assert params["min_popularity"] == "0"
+    assert params["target_valence"] == "0.0"
+
+
+def test_bad_arguments_raise_type_error(session, make_http):
+    async def main():
+        http = await make_http()
+        for call in (
+            lambda: http.get_artist(),
+            lambda: http.get_artist("a", "b"),
+            lambda: http.get_artist("a", id="b"),
+            lambda: http.get_artist("a", market="US"),
+        ):
+            with pytest.raises(TypeError):
+                await call()
+
+    asyncio.run(main())
+
+    assert session.requests == []
+
+
+def test_endpoint_rejects_unknown_argument_names():
+    with pytest.raises(TypeError):
+
+        @endpoint("GET", "tracks", lists=("id",))
+        async def get_tracks(self, ids):
+            ...
+
+
+def slow_artist(method, url, params):
+    return StubResponse(200, {"name": "artist"}, delay=0.01)
+
+
+def test_identical_concurrent_gets_share_one_request(session, make_http):
+    session.handler = slow_artist
+
+    async def main():
+        http = await make_http(cache_size=0)
+        return await asyncio.gather(*(http.get_artist("x") for _ in range(5)))
+
+    responses = asyncio.run(main())
+
+    assert len(session.requests) == 1
+    assert all(response == {"name": "artist"} for response in responses)
+
+
+def test_cancelling_one_waiter_keeps_the_request_for_the_others(session, make_http):
+    session.handler = slow_artist
+
+    async def main():
+        http = await make_http(cache_size=0)
+        first = asyncio.ensure_future(http.get_artist("x"))
+        second = asyncio.ensure_future(http.get_artist("x"))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await asyncio.gather(first, second, return_exceptions=True)
+
+    first, second = asyncio.run(main())
+
+    assert isinstance(first, asyncio.CancelledError)
+    assert second == {"name": "artist"}
+    assert len(session.requests) == 1
+
+
+def test_cancelling_the_last_waiter_cancels_the_request(session, make_http):
+    session.handler = slow_artist
+
+    async def main():
+        http = await make_http(cache_size=0)
+        waiter = asyncio.ensure_future(http.get_artist("x"))
+        await asyncio.sleep(0)
+        (inflight,) = http._inflight.values()
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        await asyncio.sleep(0)
+        return inflight, http._inflight
+
+    inflight, remaining = asyncio.run(main())
+
+    assert inflight.cancelled()
+    assert remaining == {}
+
+
+def test_request_made_right_after_cancelling_starts_a_new_one(session, make_http):
+    session.handler = slow_artist
+
+    async def main():
+        http = await make_http(cache_size=0)
+        first = asyncio.ensure_future(http.get_artist("x"))
+        await asyncio.sleep(0)
+        first.cancel()
+        second = asyncio.ensure_future(http.get_artist("x"))
+        return await asyncio.gather(first, second, return_exceptions=True)
+
+    first, second = asyncio.run(main())
+
+    assert isinstance(first, asyncio.CancelledError)
+    assert second == {"name": "artist"}
+    assert len(session.requests) == 2
+
+
+def artist_by_url(method, url, params):
+    return StubResponse(200, {"id": url.rsplit("/", 1)[-1]})
+
+
+def test_cache_hit_skips_the_session(session, make_http):
+    session.handler = artist_by_url
+
+    async def main():
+        http = await make_http()
+        return await http.get_artist("a"), await http.get_artist("a")
+
+    first, second = asyncio.run(main())
+
+    assert first == second == {"id": "a"}
+    assert len(session.requests) == 1
+
+
+def test_expired_entry_is_fetched_again(session, make_http):
+    session.handler = artist_by_url
+
+    async def main():
+        http = await make_http(cache_ttl=0.01)
+        await http.get_artist("a")
+        await asyncio.sleep(0.02)
+        await http.get_artist("a")
+
+    asyncio.run(main())
+
+    assert len(session.requests) == 2
+
+
+def test_least_recently_used_entry_is_evicted(session, make_http):
+    session.handler = artist_by_url
+
+    async def main():
+        http = await make_http(cache_size=2)
+        await http.get_artist("a")
+        await http.get_artist("b")
+        await http.get_artist("a")  # Hit, "b" becomes the least recently used
+        await http.get_artist("c")  # Evicts "b"
+        await http.get_artist("a")
+        await http.get_artist("b")
+
+    asyncio.run(main())
+
+    assert [url.rsplit("/", 1)[-1] for _, url, _ in session.requests] == [
+        "a",
+        "b",
+        "c",
+        "b",
+    ]
+
+
+def test_markets_never_expire(session, make_http):
+    async def main():
+        http = await make_http(cache_ttl=0.01)
+        await http.get_available_markets()
+        await asyncio.sleep(0.02)
+        await http.get_available_markets()
+
+    asyncio.run(main())
+
+    assert len(session.requests) == 1
+
+
+def test_cache_size_zero_disables_the_cache(session, make_http):
+    session.handler = artist_by_url
+
+    async def main():
+        http = await make_http(cache_size=0)
+        await http.get_artist("a")
+        await http.get_artist("a")
+        return http._cache
+
+    cache = asyncio.run(main())
+
+    assert len(session.requests) == 2
+    assert cache == {}
+
+
+def test_modifying_a_response_doesnt_change_the_cached_one(session, make_http):
+    session.handler = artist_by_url
+
+    async def main():
+        http = await make_http()
+        artist = await http.get_artist("a")
+        artist["id"] = "modified"
+        return await http.get_artist("a")
+
+    assert asyncio.run(main()) == {"id": "a"}
+    assert len(session.requests) == 1
+
+
+@pytest.mark.parametrize(
+    "options, expected",
+    [
+        ({}, 10),
+        ({"limit_per_host": 50}, 50),
+        ({"limit": 30, "limit_per_host": 0}, 30),
+        ({"limit_per_host": 50, "max_concurrency": 5}, 5),
+    ],
+)
+def test_max_concurrency_defaults_to_the_connection_limit(
+    session, make_http, options, expected
+):
+    async def main():
+        http = await make_http(**options)
+        return http._semaphore._value
+
+    assert asyncio.run(main()) == expected
+
+
+def test_rate_limit_back_off_is_shared_with_queued_requests(session, make_http):
+    sent_at = []
+    rate_limited = []
+
+    def handler(method, url, params):
+        now = asyncio.get_running_loop().time()
+        sent_at.append(now)
+        if not rate_limited:
+            rate_limited.append(now)
+            return StubResponse(429, headers={"Retry-After": "0.05"})
+        return StubResponse(200, {})
+
+    session.handler = handler
+
+    async def main():
+        # A single slot, so the other requests are queued on the semaphore
+        http = await make_http(max_concurrency=1, cache_size=0)
+        await asyncio.gather(*(http.get_artist(id) for id in "abc"))
+
+    asyncio.run(main())
+
+    assert len(sent_at) == 4
+    assert all(at >= rate_limited[0] + 0.05 for at in sent_at[1:])
+
+
+def test_rate_limited_requests_are_tried_five_times(session, make_http):
+    session.handler = lambda method, url, params: StubResponse(
+        429, headers={"Retry-After": "0"}
+    )
+
+    async def main():
+        http = await make_http()
+        with pytest.raises(HTTPException) as info:
+            await http.get_artist("a")
+        return info.value
+
+    exc = asyncio.run(main())
+
+    assert exc.status_code == 429
+    assert len(session.requests) == 5
+
+
+def test_reauthorizing_doesnt_use_up_the_rate_limit_tries(session, make_http):
+    responses = [
+        StubResponse(429, headers={"Retry-After": "0"}),
+        StubResponse(429, headers={"Retry-After": "0"}),
+        StubResponse(429, headers={"Retry-After": "0"}),
+        StubResponse(429, headers={"Retry-After": "0"}),
+        StubResponse(401, {"error": {"status": 401, "message": "expired"}}),
+        StubResponse(200, {"id": "a"}),
+    ]
+    session.handler = lambda method, url, params: responses.pop(0)
+
+    async def main():
+        http = await make_http()
+        session.token_responses.append(
+            StubResponse(200, {"access_token": "new", "expires_in": 3600})
+        )
+        return await http.get_artist("a")
+
+    assert asyncio.run(main()) == {"id": "a"}
+    assert [headers["Authorization"] for headers in session.headers] == [
+        "Bearer token"
+    ] * 5 + ["Bearer new"]
+
+
+def test_third_unauthorized_response_raises(session, make_http):
+    session.handler = lambda method, url, params: StubResponse(
+        401, {"error": {"status": 401, "message": "expired"}}
+    )
+
+    async def main():
+        http = await make_http()
+        with pytest.raises(NotAuthorized):
+            await http.get_artist("a")
+
+    asyncio.run(main())
+
+    assert len(session.requests) == 3